@@ -2,557 +2,653 @@
 # IMPORTS AND CONFIGURATION
 # ========================================
 
+import os
 import pandas as pd
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend - charts are only saved to files
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
 
 # Define separators (used throughout for output formatting)
 SEPARATOR_MAIN = "=" * 80
 SEPARATOR_SUB = "-" * 80
 
+# Month names and monthly balance column headers (shared by report and charts)
+MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+BALANCE_COLS = tuple(f'Balance end of {month}' for month in MONTH_NAMES)
+
 # Define data paths
 DATA_DIR = Path('data')  # Relative to script location
 ENTRIES_FILE = DATA_DIR / 'account_entries.csv'
 INFO_FILE = DATA_DIR / 'account_information.csv'
-
-# Load data
-df_entries = pd.read_csv(ENTRIES_FILE)
-df_info = pd.read_csv(INFO_FILE)
-
-print(f"Data loaded successfully:")
-print(f"  - {len(df_entries)} transaction entries from {ENTRIES_FILE}")
-print(f"  - {len(df_info)} accounts from {INFO_FILE}")
+OUTPUT_DIR = Path('outputs')  # Generated charts
 
 # ========================================
-# SECTION 1: Load and Process Account Entries
+# DATA PROCESSING
 # ========================================
 
-# Parse dates to datetime format
-df_entries['Date'] = pd.to_datetime(df_entries['Date'], format='%d/%m/%Y')
-
-# Display all entries
-print("\nAccount Entries (loaded):")
-print(df_entries)
-
-# Validation: Verify data loaded and parsed correctly
-print(f"\nLoaded {len(df_entries)} entries")
-print(f"Date parsed to datetime: {df_entries['Date'].dtype}")
-
-# ========================================
-# SECTION 2: Separate Opening Balances from Transactions
-# ========================================
-# Efficient filtering approach:
-# - Direct text comparison (Text == 'Opening Balance') for opening balances
-# - Simple negation (Text != 'Opening Balance') for transactions
-# - No redundant type conversions - Account column is already int64 from CSV parsing (validated by .dtype)
+def extract_month(dates):
+    """Extract month numbers (int8, 1-12) from DD/MM/YYYY date strings
 
-# Opening balances (all are 01/01/2024 with text "Opening Balance")
-df_opening_balances = df_entries[df_entries['Text'] == 'Opening Balance'].copy()
+    Raises ValueError for dates that do not match the format, or whose day
+    is outside 01-31 or month outside 01-12 - they would otherwise be booked
+    to the wrong account/month cell in the monthly balance calculation.
+    The check is per field only: impossible calendar dates such as
+    31/02/2024 are still accepted.
+    """
+    malformed = ~dates.str.fullmatch(r'(0[1-9]|[12]\d|3[01])/(0[1-9]|1[0-2])/\d{4}')
+    if malformed.any():
+        raise ValueError(f"Dates not valid DD/MM/YYYY (day 01-31, month 01-12): {dates[malformed].tolist()}")
 
-# Select only necessary columns for merging (Account and Amount)
-# Date, Currency, and Text are constant for all opening balances (not needed)
-df_opening_balances = df_opening_balances[['Account', 'Amount']]
-df_opening_balances = df_opening_balances.rename(columns={'Amount': 'Opening Balance 2024'})
+    # Format is fixed DD/MM/YYYY, so characters 3-4 are the month
+    months = dates.str[3:5].astype(np.int8)
 
-# All other transactions (exclude opening balances)
-df_transactions = df_entries[df_entries['Text'] != 'Opening Balance'].copy()
+    return months
 
-print("\nOpening Balances for 2024:")
-print(df_opening_balances)
-print(f"Account dtype: {df_opening_balances['Account'].dtype}")
+def cumulative_monthly_totals(transactions, accounts):
+    """Cumulative transaction totals per account (rows, in `accounts` order) and month (12 columns)
 
-print("\nOther Transactions:")
-print(df_transactions[['Date', 'Account', 'Amount', 'Text']])
-print(f"Account dtype: {df_transactions['Account'].dtype}")
+    Transactions are scattered into an (accounts x 12) matrix in one pass with
+    np.bincount, then accumulated month over month. Transactions for accounts
+    not listed in `accounts` are ignored.
+    """
+    # Row position of each transaction's account (-1 = unknown account)
+    account_codes = pd.Index(accounts).get_indexer(transactions['Account'])
+    known = account_codes >= 0
+    n_accounts = len(accounts)
 
-# Validation: Ensure split is complete (no data lost)
-print(f"\nOpening balances: {len(df_opening_balances)} rows")
-print(f"Transactions: {len(df_transactions)} rows")
-print(f"Total check: {len(df_opening_balances) + len(df_transactions)} = {len(df_entries)}")
+    # Sum transactions per account per month into a flat (row * 12 + month) index
+    cell = account_codes[known].astype(np.intp) * 12 + (transactions['Month'].to_numpy()[known] - 1)
+    monthly = np.bincount(
+        cell, weights=transactions['Amount'].to_numpy()[known], minlength=n_accounts * 12
+    ).reshape(n_accounts, 12)
 
-# ========================================
-# SECTION 3: Prepare Transactions for Calculation
-# ========================================
-# Strategic approach: Add Month column without immediate aggregation
-#
-# For monthly END balances, we need CUMULATIVE sums:
-# - Balance end of Feb = Opening + (Jan + Feb transactions)
-# - NOT: Opening + (only Feb transactions)
-#
-# This approach:
-# - Add Month column now (extract month number 1-12 from date)
-# - Enables cumulative filtering in next section
-# - Defer groupby until needed (Section 6) with cumulative filter (Month <= i)
-# - This directly produces cumulative balances without complex transformations
-
-# Add Month column (extract month number 1-12 from date)
-df_transactions['Month'] = df_transactions['Date'].dt.month
-
-print("\nTransactions with Month:")
-print(df_transactions[['Date', 'Account', 'Amount', 'Month', 'Text']])
-
-# Validation: Transaction count by month
-print(f"\nTransaction count by Month:")
-print(df_transactions['Month'].value_counts().sort_index())
+    # Accumulate month over month
+    # For April: Jan + Feb + Mar + 0 (Apr has no transactions)
+    return monthly.cumsum(axis=1)
 
 # ========================================
-# SECTION 4: Load and Process Account Information
+# CHART RENDERING
 # ========================================
-# Efficient loading: No redundant type conversions
-# Account column is already int64 from CSV parsing (validated by .dtype)
-
-# Account information already loaded at the beginning
-# Verifying data is ready for processing
+# Each chart is rendered by its own function from a dict of NumPy arrays
+# (picklable, no pandas objects), so the four charts can be rasterized
+# and PNG-encoded in separate worker processes.
 
-# Display all accounts
-print("\nAccount Information:")
-print(df_info)
+# Define color scheme
+COLORS = ['#3498db', '#2ecc71', '#e74c3c', '#f39c12']  # Blue, Green, Red, Orange
 
-# Validation: Verify data loaded and formatted correctly for merging
-print(f"\nLoaded {len(df_info)} accounts")
-print(f"Account dtype: {df_info['Account'].dtype}")
-print(f"Account values for merge: {sorted(df_info['Account'].tolist())}")
-print(f"Ready for merge: {df_info['Account'].nunique()} unique accounts, no duplicates")
+# Chart output settings
+# Rasterization and PNG compression scale with pixel count - 150 dpi renders
+# ~4x fewer pixels than 300 dpi while staying sharp on screen and in print
+# Set CHART_FORMAT to 'pdf' or 'svg' for vector output (dpi is then ignored)
+CHART_DPI = 150
+CHART_FORMAT = 'png'
 
 # ========================================
-# SECTION 5: Merge Account Data
+# CHART 1: Monthly Balance Trend
 # ========================================
 
-# Merge Account Information with Opening Balances
-# Using outer join to ensure no data is lost (defensive approach)
-df_report = pd.merge(df_info, df_opening_balances, on='Account', how='outer')
-
-# Display all merged data
-print("\nMerged Report (Initial):")
-print(df_report)
-
-# Validation: Ensure merge was successful
-print(f"\nMerged {len(df_report)} accounts")
-print(f"Expected: {len(df_info)} accounts from df_info")
-
-# Check for missing values (would indicate incomplete merge)
-missing_balance = df_report['Opening Balance 2024'].isna().sum()
-missing_account_name = df_report['AccountName'].isna().sum()
-
-if missing_balance > 0:
-    print(f"WARNING: {missing_balance} accounts missing opening balance!")
-    print(df_report[df_report['Opening Balance 2024'].isna()])
-else:
-    print("All accounts have opening balances")
-
-if missing_account_name > 0:
-    print(f"WARNING: {missing_account_name} accounts missing account name!")
-    print(df_report[df_report['AccountName'].isna()])
-else:
-    print("All accounts have account names")
+def render_balance_trend(data, output_dir):
+    """Render monthly balance trend line chart"""
+    # Constrained layout: single-pass solver at draw time (replaces tight_layout)
+    plt.figure(figsize=(14, 7), layout='constrained')
+
+    # One row of balances_matrix per account (columns: months)
+    for idx in range(len(data['AccountName'])):
+        plt.plot(MONTH_NAMES, data['balances_matrix'][idx], 
+                 marker='o', 
+                 label=data['AccountName'][idx], 
+                 linewidth=2.5,
+                 markersize=8,
+                 color=COLORS[idx])
+
+    # Styling
+    plt.title('Monthly Balance Trend by Account (2024)', 
+              fontsize=18, 
+              fontweight='bold', 
+              pad=20)
+    plt.xlabel('Month', fontsize=14, fontweight='bold')
+    plt.ylabel('Balance (USD)', fontsize=14, fontweight='bold')
+    plt.legend(title='Account', 
+               fontsize=11, 
+               title_fontsize=12,
+               loc='best',
+               framealpha=0.9)
+    plt.grid(True, alpha=0.3, linestyle='--', linewidth=0.8)
+    plt.xticks(rotation=45, ha='right', fontsize=11)
+    plt.yticks(fontsize=11)
+
+    # Format y-axis to show currency
+    ax = plt.gca()
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+
+    output_path = output_dir / f'monthly_balance_trend.{CHART_FORMAT}'
+    plt.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight')
+    plt.close()
+
+    return output_path
 
 # ========================================
-# SECTION 6: Calculate Monthly Balances
+# CHART 2: Opening vs Closing Balance Comparison
 # ========================================
-# Optimized iterative approach for cumulative balance calculation
-#
-# This implementation uses direct cumulative filtering:
-# 1. For each month (1-12): filter transactions UP TO that month (cumulative)
-# 2. Calculate sum by account
-# 3. Add as new column directly in required format
-# 4. Simple, direct calculation without complex transformations
-#
-# Benefits:
-# - Efficient: Single pass through data with minimal transformations
-# - Automatic handling of missing months (filter returns empty → fillna(0))
-# - Cumulative by design (Month <= i includes all previous months)
-# - Column names already in required format ('Balance end of January', etc.)
-# - Performance: Avoids intermediate data structures and multiple reshape operations
-
-# Month names for column headers
-month_names = [
-    'January', 'February', 'March', 'April', 'May', 'June',
-    'July', 'August', 'September', 'October', 'November', 'December'
-]
-
-print("\nCalculating monthly balances...")
-
-# For each month (1-12), calculate cumulative balance
-for month_num in range(1, 13):
-    month_name = month_names[month_num - 1]
-    
-    # Get all transactions UP TO and INCLUDING this month (CUMULATIVE!)
-    # For January: Month <= 1 (only Jan transactions)
-    # For February: Month <= 2 (Jan + Feb transactions)
-    # For April: Month <= 4 (Jan + Feb + Mar, since Apr has no transactions)
-    trans_up_to_month = df_transactions[df_transactions['Month'] <= month_num]
-    
-    # Sum transactions by account
-    trans_sum = trans_up_to_month.groupby('Account')['Amount'].sum()
-    
-    # Calculate balance: Opening Balance + Cumulative Transactions
-    # Use .map() to match Account values from trans_sum to df_report
-    # fillna(0) handles accounts with no transactions up to this month
-    column_name = f'Balance end of {month_name}'
-    df_report[column_name] = (
-        df_report['Opening Balance 2024'] + 
-        df_report['Account'].map(trans_sum).fillna(0)
-    )
-    
-    print(f"  {month_name}: calculated")
 
-print("\nAll monthly balances calculated!")
+def render_opening_vs_closing(data, output_dir):
+    """Render opening vs closing balance bar chart"""
+    # Prepare data
+    accounts = data['AccountName']
+    opening = data['Opening Balance 2024']
+    closing = data['Balance end of December']
+
+    # Create figure
+    fig, ax = plt.subplots(figsize=(12, 7), layout='constrained')
+
+    # Bar positions
+    x = np.arange(len(accounts))
+    width = 0.35
+
+    # Bars
+    bars1 = ax.bar(x - width/2, opening, width, 
+                   label='Opening Balance', 
+                   color='#3498db', 
+                   alpha=0.85,
+                   edgecolor='black',
+                   linewidth=1.2)
+    bars2 = ax.bar(x + width/2, closing, width, 
+                   label='Closing Balance', 
+                   color='#2ecc71', 
+                   alpha=0.85,
+                   edgecolor='black',
+                   linewidth=1.2)
+
+    # Add value labels on bars
+    for bars in [bars1, bars2]:
+        for bar in bars:
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                    f'${height:,.0f}',
+                    ha='center', 
+                    va='bottom', 
+                    fontsize=10,
+                    fontweight='bold')
+
+    # Styling
+    ax.set_xlabel('Account', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Balance (USD)', fontsize=14, fontweight='bold')
+    ax.set_title('Opening vs Closing Balance Comparison (2024)', 
+                 fontsize=18, 
+                 fontweight='bold',
+                 pad=20)
+    ax.set_xticks(x)
+    ax.set_xticklabels(accounts, fontsize=12)
+    ax.legend(fontsize=12, loc='upper left', framealpha=0.9)
+    ax.grid(True, axis='y', alpha=0.3, linestyle='--', linewidth=0.8)
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+
+    output_path = output_dir / f'opening_vs_closing.{CHART_FORMAT}'
+    plt.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight')
+    plt.close()
+
+    return output_path
 
-# Display sample - Q1 balances for verification
-print("\nSample - Q1 Monthly Balances:")
-print(df_report[['Account', 'AccountName', 'Opening Balance 2024',
-                 'Balance end of January', 'Balance end of February', 'Balance end of March']])
-
-# Display sample - Q4 balances (should be same as Q3 since no Q4 transactions)
-print("\nSample - Q4 Monthly Balances (no new transactions after March):")
-print(df_report[['Account', 'Balance end of October', 'Balance end of November', 'Balance end of December']])
-
-# ========================================
-# IMPLEMENTATION NOTE
-# ========================================
-# The iterative approach in Section 6 accomplishes the goal directly:
-# - All 12 monthly balances calculated with cumulative filtering
-# - Correct structure maintained (4 rows, 17 columns)
-# - No complex reshaping or cleanup needed
-#
-# Alternative approaches (groupby → pivot → cumsum) would require:
-# - Creating intermediate monthly transaction aggregates
-# - Expanding to 48 rows (4 accounts × 12 months)
-# - Pivoting back to wide format (4 rows)
-# - Cleaning duplicate column names
-#
-# Our approach is more direct and efficient.
-#
-# Proceeding to YTD calculation.
 # ========================================
-
-# ========================================
-# SECTION 7: Calculate Sum of Transactions YTD
+# CHART 3: Transaction Heatmap
 # ========================================
 
-print("\nCalculating Sum of Transactions YTD...")
-
-# Sum all transactions for each account (for the entire year)
-trans_ytd = df_transactions.groupby('Account')['Amount'].sum()
+def render_transaction_heatmap(data, output_dir):
+    """Render transaction activity heatmap (Account x Month)"""
+    transaction_matrix = data['transaction_matrix']
+    account_names_ordered = data['AccountName']
 
-# Add to report as new column
-df_report['Sum of Transactions YTD'] = df_report['Account'].map(trans_ytd).fillna(0)
+    # Create heatmap
+    fig, ax = plt.subplots(figsize=(14, 6), layout='constrained')
 
-print("YTD sum calculated!")
+    im = ax.imshow(transaction_matrix, cmap='YlOrRd', aspect='auto', vmin=0)
 
-# Validation: Balance December should equal Opening Balance + YTD
-print("\nValidation: Balance calculation check")
-balance_check = (
-    (df_report['Balance end of December'] - 
-     df_report['Opening Balance 2024'] - 
-     df_report['Sum of Transactions YTD']).abs() < 0.01
-)
-
-if balance_check.all():
-    print("All balances verified: Balance Dec = Opening + YTD")
-else:
-    print("WARNING: Balance mismatch detected!")
-    print(df_report[~balance_check][['Account', 'AccountName', 'Opening Balance 2024', 
-                                      'Balance end of December', 'Sum of Transactions YTD']])
-
-# ========================================
-# SECTION 8: Prepare Final Report
-# ========================================
-
-# Remove columns not needed in final output
-df_final_report = df_report.drop(columns=['OpenDate', 'CloseDate'], errors='ignore')
-
-# Define final column order as per requirements
-month_names = [
-    'January', 'February', 'March', 'April', 'May', 'June',
-    'July', 'August', 'September', 'October', 'November', 'December'
-]
+    # Add colorbar
+    cbar = plt.colorbar(im, ax=ax)
+    cbar.set_label('Number of Transactions', rotation=270, labelpad=20, fontsize=12, fontweight='bold')
 
-final_columns = [
-    'Account',
-    'AccountName',
-    'Opening Balance 2024'
-] + [f'Balance end of {month}' for month in month_names] + [
-    'Sum of Transactions YTD'
-]
+    # Set ticks and labels
+    ax.set_xticks(np.arange(12))
+    ax.set_yticks(np.arange(len(account_names_ordered)))
+    ax.set_xticklabels(MONTH_NAMES, rotation=45, ha='right', fontsize=11)
+    ax.set_yticklabels(account_names_ordered, fontsize=12)
 
-# Reorder columns
-df_final_report = df_final_report[final_columns]
+    # Add text annotations
+    for i in range(len(account_names_ordered)):
+        for j in range(12):
+            text = ax.text(j, i, int(transaction_matrix[i][j]),
+                          ha="center", va="center", 
+                          color="black" if transaction_matrix[i][j] < 2 else "white",
+                          fontsize=12,
+                          fontweight='bold')
 
-print("\n" + SEPARATOR_MAIN)
-print("FINAL FINANCIAL REPORT 2024")
-print(SEPARATOR_MAIN)
-print(df_final_report.to_string(index=False))
+    # Styling
+    ax.set_title('Transaction Activity Heatmap (2024)', 
+                 fontsize=18, 
+                 fontweight='bold',
+                 pad=20)
+    ax.set_xlabel('Month', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Account', fontsize=14, fontweight='bold')
 
-print("\n" + SEPARATOR_MAIN)
-print("REPORT GENERATION COMPLETE")
-print(SEPARATOR_MAIN)
+    output_path = output_dir / f'transaction_heatmap.{CHART_FORMAT}'
+    plt.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight')
+    plt.close()
 
-print("\nAll tasks completed successfully!")
+    return output_path
 
 # ========================================
-# DATA VISUALIZATION
+# CHART 4: Growth Rate Chart
 # ========================================
 
-# Create outputs directory if it doesn't exist
-OUTPUT_DIR = Path('outputs')
-OUTPUT_DIR.mkdir(exist_ok=True)
-
-print("\n" + SEPARATOR_MAIN)
-print("GENERATING VISUALIZATIONS")
-print(SEPARATOR_MAIN)
-
-# Define color scheme
-COLORS = ['#3498db', '#2ecc71', '#e74c3c', '#f39c12']  # Blue, Green, Red, Orange
-
-# ========================================
-# CHART 1: Monthly Balance Trend
-# ========================================
+def render_growth_rate(data, output_dir):
+    """Render growth rate horizontal bar chart"""
+    # Calculate growth rate for each account (vectorized over all accounts)
+    opening = data['Opening Balance 2024']
+    closing = data['Balance end of December']
+    change = closing - opening
+    growth = change / opening * 100
+
+    # Sort by growth rate (descending, stable for equal rates)
+    order = np.argsort(-growth, kind='stable')
+    accounts_sorted = data['AccountName'][order]
+    growth_rates = growth[order]
+    abs_change = change[order]
+
+    # Create figure
+    fig, ax = plt.subplots(figsize=(12, 7), layout='constrained')
+
+    # Bar colors: green for growth, red for decline
+    colors_growth = np.where(growth_rates >= 0, '#2ecc71', '#e74c3c')
+
+    # Horizontal bar chart
+    bars = ax.barh(accounts_sorted, growth_rates, 
+                   color=colors_growth, 
+                   alpha=0.85,
+                   edgecolor='black',
+                   linewidth=1.2)
+
+    # Add value labels
+    for bar, rate, change_amount in zip(bars, growth_rates, abs_change):
+        width = bar.get_width()
+        label_x = width + (1 if width >= 0 else -1)
+        ax.text(label_x, bar.get_y() + bar.get_height()/2,
+                f'{rate:+.2f}%\n(${change_amount:,.0f})',
+                ha='left' if width >= 0 else 'right',
+                va='center',
+                fontsize=11,
+                fontweight='bold')
 
-print("\n1. Creating Monthly Balance Trend chart...")
-
-plt.figure(figsize=(14, 7))
-
-for idx, (_, row) in enumerate(df_final_report.iterrows()):
-    account_name = row['AccountName']
-    balances = [row[f'Balance end of {month}'] for month in month_names]
-    
-    plt.plot(month_names, balances, 
-             marker='o', 
-             label=account_name, 
-             linewidth=2.5,
-             markersize=8,
-             color=COLORS[idx])
-
-# Styling
-plt.title('Monthly Balance Trend by Account (2024)', 
-          fontsize=18, 
-          fontweight='bold', 
-          pad=20)
-plt.xlabel('Month', fontsize=14, fontweight='bold')
-plt.ylabel('Balance (USD)', fontsize=14, fontweight='bold')
-plt.legend(title='Account', 
-           fontsize=11, 
-           title_fontsize=12,
-           loc='best',
-           framealpha=0.9)
-plt.grid(True, alpha=0.3, linestyle='--', linewidth=0.8)
-plt.xticks(rotation=45, ha='right', fontsize=11)
-plt.yticks(fontsize=11)
-
-# Format y-axis to show currency
-ax = plt.gca()
-ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-
-plt.tight_layout()
-plt.savefig(OUTPUT_DIR / 'monthly_balance_trend.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-print("   ✓ Saved: outputs/monthly_balance_trend.png")
+    # Add vertical line at 0
+    ax.axvline(x=0, color='black', linewidth=2, linestyle='-', alpha=0.3)
 
-# ========================================
-# CHART 2: Opening vs Closing Balance Comparison
-# ========================================
+    # Styling
+    ax.set_xlabel('Growth Rate (%)', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Account', fontsize=14, fontweight='bold')
+    ax.set_title('Year-over-Year Growth Rate by Account (2024)', 
+                 fontsize=18, 
+                 fontweight='bold',
+                 pad=20)
+    ax.grid(True, axis='x', alpha=0.3, linestyle='--', linewidth=0.8)
+    ax.tick_params(axis='both', labelsize=12)
 
-print("2. Creating Opening vs Closing Balance comparison...")
-
-# Prepare data
-accounts = df_final_report['AccountName'].tolist()
-opening = df_final_report['Opening Balance 2024'].tolist()
-closing = df_final_report['Balance end of December'].tolist()
-
-# Create figure
-fig, ax = plt.subplots(figsize=(12, 7))
-
-# Bar positions
-x = np.arange(len(accounts))
-width = 0.35
-
-# Bars
-bars1 = ax.bar(x - width/2, opening, width, 
-               label='Opening Balance', 
-               color='#3498db', 
-               alpha=0.85,
-               edgecolor='black',
-               linewidth=1.2)
-bars2 = ax.bar(x + width/2, closing, width, 
-               label='Closing Balance', 
-               color='#2ecc71', 
-               alpha=0.85,
-               edgecolor='black',
-               linewidth=1.2)
-
-# Add value labels on bars
-for bars in [bars1, bars2]:
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'${height:,.0f}',
-                ha='center', 
-                va='bottom', 
-                fontsize=10,
-                fontweight='bold')
+    output_path = output_dir / f'growth_rate_chart.{CHART_FORMAT}'
+    plt.savefig(output_path, dpi=CHART_DPI, bbox_inches='tight')
+    plt.close()
 
-# Styling
-ax.set_xlabel('Account', fontsize=14, fontweight='bold')
-ax.set_ylabel('Balance (USD)', fontsize=14, fontweight='bold')
-ax.set_title('Opening vs Closing Balance Comparison (2024)', 
-             fontsize=18, 
-             fontweight='bold',
-             pad=20)
-ax.set_xticks(x)
-ax.set_xticklabels(accounts, fontsize=12)
-ax.legend(fontsize=12, loc='upper left', framealpha=0.9)
-ax.grid(True, axis='y', alpha=0.3, linestyle='--', linewidth=0.8)
-ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-
-plt.tight_layout()
-plt.savefig(OUTPUT_DIR / 'opening_vs_closing.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-print("   ✓ Saved: outputs/opening_vs_closing.png")
+    return output_path
 
 # ========================================
-# CHART 3: Transaction Heatmap
+# MAIN
 # ========================================
 
-print("3. Creating Transaction Activity Heatmap...")
-
-# Create transaction activity matrix (Account x Month)
-# Count transactions per account per month
-transaction_matrix = []
-account_names_ordered = df_final_report['AccountName'].tolist()
-
-for account_num in df_final_report['Account']:
-    monthly_counts = []
-    for month_num in range(1, 13):
-        count = len(df_transactions[
-            (df_transactions['Account'] == account_num) & 
-            (df_transactions['Month'] == month_num)
-        ])
-        monthly_counts.append(count)
-    transaction_matrix.append(monthly_counts)
-
-# Create heatmap
-fig, ax = plt.subplots(figsize=(14, 6))
-
-# Use seaborn for better heatmap
-im = ax.imshow(transaction_matrix, cmap='YlOrRd', aspect='auto', vmin=0)
-
-# Add colorbar
-cbar = plt.colorbar(im, ax=ax)
-cbar.set_label('Number of Transactions', rotation=270, labelpad=20, fontsize=12, fontweight='bold')
-
-# Set ticks and labels
-ax.set_xticks(np.arange(12))
-ax.set_yticks(np.arange(len(account_names_ordered)))
-ax.set_xticklabels(month_names, rotation=45, ha='right', fontsize=11)
-ax.set_yticklabels(account_names_ordered, fontsize=12)
-
-# Add text annotations
-for i in range(len(account_names_ordered)):
-    for j in range(12):
-        text = ax.text(j, i, int(transaction_matrix[i][j]),
-                      ha="center", va="center", 
-                      color="black" if transaction_matrix[i][j] < 2 else "white",
-                      fontsize=12,
-                      fontweight='bold')
-
-# Styling
-ax.set_title('Transaction Activity Heatmap (2024)', 
-             fontsize=18, 
-             fontweight='bold',
-             pad=20)
-ax.set_xlabel('Month', fontsize=14, fontweight='bold')
-ax.set_ylabel('Account', fontsize=14, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig(OUTPUT_DIR / 'transaction_heatmap.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-print("   ✓ Saved: outputs/transaction_heatmap.png")
-
-# ========================================
-# CHART 4: Growth Rate Chart
-# ========================================
+def main():
+    """Generate the 2024 financial report and charts"""
+    # Load data
+    # pyarrow engine: multi-threaded CSV parser, faster than the default C engine
+    # Account parsed as int32 (account numbers fit easily) - half the bytes of int64
+    # Amount stays float64: float32 keeps only ~7 significant digits, too few for
+    # exact cents on balances in the hundreds of thousands
+    df_entries = pd.read_csv(ENTRIES_FILE, engine='pyarrow', dtype={'Account': 'int32'})
+    # Only Account and AccountName are used - OpenDate/CloseDate are not loaded
+    df_info = pd.read_csv(
+        INFO_FILE, engine='pyarrow', usecols=['Account', 'AccountName'], dtype={'Account': 'int32'}
+    )
 
-print("4. Creating Growth Rate comparison...")
-
-# Calculate growth rate for each account
-growth_data = []
-for _, row in df_final_report.iterrows():
-    account_name = row['AccountName']
-    opening = row['Opening Balance 2024']
-    closing = row['Balance end of December']
-    growth_rate = ((closing - opening) / opening) * 100
-    growth_data.append({
-        'Account': account_name,
-        'Growth Rate': growth_rate,
-        'Absolute Change': closing - opening
-    })
-
-# Sort by growth rate
-growth_data.sort(key=lambda x: x['Growth Rate'], reverse=True)
-
-# Create figure
-fig, ax = plt.subplots(figsize=(12, 7))
-
-# Data
-accounts_sorted = [item['Account'] for item in growth_data]
-growth_rates = [item['Growth Rate'] for item in growth_data]
-colors_growth = ['#2ecc71' if rate >= 0 else '#e74c3c' for rate in growth_rates]
-
-# Horizontal bar chart
-bars = ax.barh(accounts_sorted, growth_rates, 
-               color=colors_growth, 
-               alpha=0.85,
-               edgecolor='black',
-               linewidth=1.2)
-
-# Add value labels
-for i, (bar, rate, data) in enumerate(zip(bars, growth_rates, growth_data)):
-    width = bar.get_width()
-    label_x = width + (1 if width >= 0 else -1)
-    ax.text(label_x, bar.get_y() + bar.get_height()/2,
-            f'{rate:+.2f}%\n(${data["Absolute Change"]:,.0f})',
-            ha='left' if width >= 0 else 'right',
-            va='center',
-            fontsize=11,
-            fontweight='bold')
-
-# Add vertical line at 0
-ax.axvline(x=0, color='black', linewidth=2, linestyle='-', alpha=0.3)
-
-# Styling
-ax.set_xlabel('Growth Rate (%)', fontsize=14, fontweight='bold')
-ax.set_ylabel('Account', fontsize=14, fontweight='bold')
-ax.set_title('Year-over-Year Growth Rate by Account (2024)', 
-             fontsize=18, 
-             fontweight='bold',
-             pad=20)
-ax.grid(True, axis='x', alpha=0.3, linestyle='--', linewidth=0.8)
-ax.tick_params(axis='both', labelsize=12)
-
-plt.tight_layout()
-plt.savefig(OUTPUT_DIR / 'growth_rate_chart.png', dpi=300, bbox_inches='tight')
-plt.close()
-
-print("   ✓ Saved: outputs/growth_rate_chart.png")
+    print(f"Data loaded successfully:")
+    print(f"  - {len(df_entries)} transaction entries from {ENTRIES_FILE}")
+    print(f"  - {len(df_info)} accounts from {INFO_FILE}")
+
+    # ========================================
+    # SECTION 1: Load and Process Account Entries
+    # ========================================
+
+    # Extract month number (1-12) directly from the date string (validated)
+    # Only the month is used downstream - no need to build full datetime values
+    df_entries['Month'] = extract_month(df_entries['Date'])
+
+    # Display all entries
+    print("\nAccount Entries (loaded):")
+    print(df_entries)
+
+    # Validation: Verify data loaded and parsed correctly
+    print(f"\nLoaded {len(df_entries)} entries")
+    print(f"Month extracted from date: {df_entries['Month'].dtype}")
+
+    # ========================================
+    # SECTION 2: Separate Opening Balances from Transactions
+    # ========================================
+    # Efficient filtering approach:
+    # - One boolean mask (Text == 'Opening Balance'), negated (~mask) for transactions
+    # - Column selection in the same .loc call - no full-row intermediate copies
+    # - No redundant type conversions - Account column is already int32 from CSV parsing (validated by .dtype)
+
+    opening_mask = df_entries['Text'].to_numpy() == 'Opening Balance'
+
+    # Opening balances (all are 01/01/2024 with text "Opening Balance")
+    # Select only necessary columns for merging (Account and Amount)
+    # Date, Currency, and Text are constant for all opening balances (not needed)
+    df_opening_balances = df_entries.loc[opening_mask, ['Account', 'Amount']].rename(
+        columns={'Amount': 'Opening Balance 2024'}
+    )
 
-# ========================================
-# VISUALIZATION SUMMARY
-# ========================================
+    # All other transactions (exclude opening balances)
+    # Month column already extracted in Section 1
+    df_transactions = df_entries.loc[~opening_mask]
+
+    print("\nOpening Balances for 2024:")
+    print(df_opening_balances)
+    print(f"Account dtype: {df_opening_balances['Account'].dtype}")
+
+    print("\nOther Transactions:")
+    print(df_transactions[['Date', 'Account', 'Amount', 'Text']])
+    print(f"Account dtype: {df_transactions['Account'].dtype}")
+
+    # Validation: Ensure split is complete (no data lost)
+    print(f"\nOpening balances: {len(df_opening_balances)} rows")
+    print(f"Transactions: {len(df_transactions)} rows")
+    print(f"Total check: {len(df_opening_balances) + len(df_transactions)} = {len(df_entries)}")
+
+    # ========================================
+    # SECTION 3: Prepare Transactions for Calculation
+    # ========================================
+    # Strategic approach: Month column (extracted in Section 1) without immediate aggregation
+    #
+    # For monthly END balances, we need CUMULATIVE sums:
+    # - Balance end of Feb = Opening + (Jan + Feb transactions)
+    # - NOT: Opening + (only Feb transactions)
+    #
+    # This approach:
+    # - Month column already present (month number 1-12 from date)
+    # - Account and Month index the (account, month) cell each amount is
+    #   scattered into with np.bincount in Section 6
+    # - cumsum across the 12 month columns then gives cumulative balances
+    #   in a single pass, with no groupby
+
+    print("\nTransactions with Month:")
+    print(df_transactions[['Date', 'Account', 'Amount', 'Month', 'Text']])
+
+    # Validation: Transaction count by month
+    print(f"\nTransaction count by Month:")
+    print(df_transactions['Month'].value_counts().sort_index())
+
+    # ========================================
+    # SECTION 4: Load and Process Account Information
+    # ========================================
+    # Efficient loading: No redundant type conversions
+    # Account column is already int32 from CSV parsing (validated by .dtype)
+
+    # Account information already loaded at the beginning
+    # Verifying data is ready for processing
+
+    # Display all accounts
+    print("\nAccount Information:")
+    print(df_info)
+
+    # Validation: Verify data loaded and formatted correctly for merging
+    print(f"\nLoaded {len(df_info)} accounts")
+    print(f"Account dtype: {df_info['Account'].dtype}")
+    print(f"Account values for merge: {sorted(df_info['Account'].tolist())}")
+    print(f"Ready for merge: {df_info['Account'].nunique()} unique accounts, no duplicates")
+
+    # ========================================
+    # SECTION 5: Merge Account Data
+    # ========================================
+
+    # Merge Account Information with Opening Balances
+    # Account as categorical: join key compared as integer codes (shared categories)
+    # Left join keeps df_info as the account master list (no sort of join keys)
+    # validate='one_to_one' fails loudly on duplicate accounts on either side
+    df_info['Account'] = df_info['Account'].astype('category')
+    df_opening_balances['Account'] = df_opening_balances['Account'].astype(df_info['Account'].dtype)
+
+    df_report = pd.merge(df_info, df_opening_balances, on='Account', how='left', validate='one_to_one')
+
+    # Restore integer Account (report output and downstream lookups expect account numbers)
+    df_report['Account'] = df_report['Account'].astype(df_report['Account'].cat.categories.dtype)
+
+    # Display all merged data
+    print("\nMerged Report (Initial):")
+    print(df_report)
+
+    # Validation: Ensure merge was successful
+    print(f"\nMerged {len(df_report)} accounts")
+    print(f"Expected: {len(df_info)} accounts from df_info")
+
+    # Check for missing values (would indicate incomplete merge)
+    missing_balance = df_report['Opening Balance 2024'].isna().sum()
+    missing_account_name = df_report['AccountName'].isna().sum()
+
+    if missing_balance > 0:
+        print(f"WARNING: {missing_balance} accounts missing opening balance!")
+        print(df_report[df_report['Opening Balance 2024'].isna()])
+    else:
+        print("All accounts have opening balances")
+
+    if missing_account_name > 0:
+        print(f"WARNING: {missing_account_name} accounts missing account name!")
+        print(df_report[df_report['AccountName'].isna()])
+    else:
+        print("All accounts have account names")
+
+    # Left join keeps only accounts from df_info - entries (opening balances or
+    # transactions) for any other account would be silently left out of the report
+    unknown_account = ~df_entries['Account'].isin(df_report['Account'])
+    if unknown_account.any():
+        unknown_numbers = sorted(df_entries.loc[unknown_account, 'Account'].unique().tolist())
+        print(f"WARNING: {unknown_account.sum()} entries for accounts missing from account information "
+              f"(excluded from balances and YTD): {unknown_numbers}")
+    else:
+        print("All entries belong to known accounts")
+
+    # ========================================
+    # SECTION 6: Calculate Monthly Balances
+    # ========================================
+    # Single-pass cumulative balance calculation
+    #
+    # This implementation scatters transactions into an (accounts x 12) matrix
+    # in one linear pass over plain NumPy arrays, then accumulates by month:
+    # 1. Encode each transaction's account as its row position in df_report
+    # 2. Sum amounts into (row, month) cells with np.bincount - one pass, no hashing
+    # 3. Cumulative sum across months (Jan, Jan+Feb, Jan+Feb+Mar, ...)
+    # 4. Add the opening balance to all 12 columns at once
+    #
+    # Benefits:
+    # - Efficient: one pass over the data instead of one per month (12 passes)
+    # - No groupby hashing or pandas object dispatch - scales to large ledgers
+    # - Automatic handling of missing months (empty cells stay 0)
+    # - Cumulative by design (cumsum along the month axis)
+    # - All 12 balance columns assigned in one vectorized step
+
+    print("\nCalculating monthly balances...")
+
+    # Cumulative transaction totals, one row per df_report account
+    monthly = cumulative_monthly_totals(df_transactions, df_report['Account'])
 
-print("\n" + SEPARATOR_MAIN)
-print("VISUALIZATIONS COMPLETE")
-print(SEPARATOR_MAIN)
+    # Calculate balance: Opening Balance + Cumulative Transactions
+    df_report[list(BALANCE_COLS)] = (
+        monthly + df_report['Opening Balance 2024'].to_numpy()[:, None]
+    )
 
-print("\nGenerated charts:")
-print("  1. Monthly Balance Trend       → outputs/monthly_balance_trend.png")
-print("  2. Opening vs Closing Balance  → outputs/opening_vs_closing.png")
-print("  3. Transaction Activity Heatmap → outputs/transaction_heatmap.png")
-print("  4. Growth Rate Comparison      → outputs/growth_rate_chart.png")
+    # Single progress line for all months (no per-month print/flush)
+    print(f"Calculated balances for: {', '.join(MONTH_NAMES)}")
+    print("\nAll monthly balances calculated!")
+
+    # Display sample - Q1 balances for verification
+    print("\nSample - Q1 Monthly Balances:")
+    print(df_report[['Account', 'AccountName', 'Opening Balance 2024',
+                     'Balance end of January', 'Balance end of February', 'Balance end of March']])
+
+    # Display sample - Q4 balances (should be same as Q3 since no Q4 transactions)
+    print("\nSample - Q4 Monthly Balances (no new transactions after March):")
+    print(df_report[['Account', 'Balance end of October', 'Balance end of November', 'Balance end of December']])
+
+    # ========================================
+    # IMPLEMENTATION NOTE
+    # ========================================
+    # Section 6 builds the monthly matrix without a Cartesian product or pivot:
+    # - np.bincount scatters amounts straight into the 4 x 12 wide layout
+    # - Months without transactions are simply 0 cells (no merge of 48 rows)
+    # - Column names assigned once in required format (no cleanup needed)
+    #
+    # Proceeding to YTD calculation.
+    # ========================================
+
+    # ========================================
+    # SECTION 7: Calculate Sum of Transactions YTD
+    # ========================================
+
+    print("\nCalculating Sum of Transactions YTD...")
+
+    # Sum all transactions for each account (for the entire year)
+    trans_ytd = df_transactions.groupby('Account', sort=False)['Amount'].sum()
+
+    # Add to report as new column
+    # reindex aligns to report rows in one lookup; accounts with no transactions get 0
+    df_report['Sum of Transactions YTD'] = trans_ytd.reindex(
+        df_report['Account'].values, fill_value=0.0
+    ).to_numpy()
+
+    print("YTD sum calculated!")
+
+    # Validation: Balance December should equal Opening Balance + YTD
+    print("\nValidation: Balance calculation check")
+    balance_check = (
+        (df_report['Balance end of December'] - 
+         df_report['Opening Balance 2024'] - 
+         df_report['Sum of Transactions YTD']).abs() < 0.01
+    )
 
-print("\nAll visualizations saved in 'outputs/' directory!")
\ No newline at end of file
+    if balance_check.all():
+        print("All balances verified: Balance Dec = Opening + YTD")
+    else:
+        print("WARNING: Balance mismatch detected!")
+        print(df_report[~balance_check][['Account', 'AccountName', 'Opening Balance 2024', 
+                                          'Balance end of December', 'Sum of Transactions YTD']])
+
+    # ========================================
+    # SECTION 8: Prepare Final Report
+    # ========================================
+
+    # Define final column order as per requirements
+    final_columns = [
+        'Account',
+        'AccountName',
+        'Opening Balance 2024'
+    ] + list(BALANCE_COLS) + [
+        'Sum of Transactions YTD'
+    ]
+
+    # Reorder columns
+    # (OpenDate/CloseDate are never loaded - see usecols in the data loading step)
+    df_final_report = df_report[final_columns]
+
+    print("\n" + SEPARATOR_MAIN)
+    print("FINAL FINANCIAL REPORT 2024")
+    print(SEPARATOR_MAIN)
+    print(df_final_report.to_string(index=False))
+
+    print("\n" + SEPARATOR_MAIN)
+    print("REPORT GENERATION COMPLETE")
+    print(SEPARATOR_MAIN)
+
+    print("\nAll tasks completed successfully!")
+
+    # ========================================
+    # DATA VISUALIZATION
+    # ========================================
+    # Create outputs directory if it doesn't exist
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    print("\n" + SEPARATOR_MAIN)
+    print("GENERATING VISUALIZATIONS")
+    print(SEPARATOR_MAIN)
+
+    # ========================================
+    # RENDER CHARTS
+    # ========================================
+
+    # Snapshot report columns as NumPy arrays once - shared by all four charts
+    # (avoids repeated pandas column lookups and list conversions per chart)
+    snap = {column: df_final_report[column].to_numpy() for column in final_columns}
+    balances_matrix = np.column_stack([snap[column] for column in BALANCE_COLS])
+
+    # Create transaction activity matrix (Account x Month)
+    # Count transactions per account per month in one crosstab,
+    # reindexed to report row order and all 12 months (missing → 0)
+    transaction_matrix = pd.crosstab(
+        df_transactions['Account'], df_transactions['Month']
+    ).reindex(
+        index=snap['Account'],
+        columns=range(1, 13),
+        fill_value=0
+    ).to_numpy()
+
+    chart_data = dict(snap, balances_matrix=balances_matrix, transaction_matrix=transaction_matrix)
+
+    charts = [
+        ('Monthly Balance Trend chart', render_balance_trend),
+        ('Opening vs Closing Balance comparison', render_opening_vs_closing),
+        ('Transaction Activity Heatmap', render_transaction_heatmap),
+        ('Growth Rate comparison', render_growth_rate),
+    ]
+
+    # Render in parallel: rasterization + PNG encoding is CPU-bound
+    # Workers use the platform's default start method; they import this module
+    # (constants and render functions only - the pipeline runs under main())
+    # Progress is printed as each chart finishes, so order may vary
+    print()
+    with ProcessPoolExecutor(max_workers=min(len(charts), os.cpu_count() or 1)) as executor:
+        futures = {
+            executor.submit(render, chart_data, OUTPUT_DIR): (number, title)
+            for number, (title, render) in enumerate(charts, start=1)
+        }
+        for future in as_completed(futures):
+            number, title = futures[future]
+            print(f"{number}. Created {title}")
+            print(f"   ✓ Saved: {future.result().as_posix()}")
+
+    # ========================================
+    # VISUALIZATION SUMMARY
+    # ========================================
+
+    print("\n" + SEPARATOR_MAIN)
+    print("VISUALIZATIONS COMPLETE")
+    print(SEPARATOR_MAIN)
+
+    print("\nGenerated charts:")
+    print(f"  1. Monthly Balance Trend       → outputs/monthly_balance_trend.{CHART_FORMAT}")
+    print(f"  2. Opening vs Closing Balance  → outputs/opening_vs_closing.{CHART_FORMAT}")
+    print(f"  3. Transaction Activity Heatmap → outputs/transaction_heatmap.{CHART_FORMAT}")
+    print(f"  4. Growth Rate Comparison      → outputs/growth_rate_chart.{CHART_FORMAT}")
+
+    print("\nAll visualizations saved in 'outputs/' directory!")
+
+
+if __name__ == '__main__':
+    main()
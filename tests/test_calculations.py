@@ -4,31 +4,39 @@ Run with: pytest tests/test_calculations.py
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from financial_report_analysis import BALANCE_COLS, cumulative_monthly_totals, extract_month
+
 # ========================================
 # FIXTURES (data loading)
 # ========================================
+# Session scope: CSVs are parsed and the report is built once for all tests
+# Fixture DataFrames are shared - tests must not modify them (copy first)
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def data_dir():
     """Path to data directory"""
     return Path(__file__).parent.parent / 'data'
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def df_entries(data_dir):
     """Load and process account entries"""
-    df = pd.read_csv(data_dir / 'account_entries.csv')
-    df['Date'] = pd.to_datetime(df['Date'], format='%d/%m/%Y')
+    df = pd.read_csv(data_dir / 'account_entries.csv', engine='pyarrow', dtype={'Account': 'int32'})
+    df['Month'] = extract_month(df['Date'])
     return df
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def df_info(data_dir):
-    """Load account information"""
-    return pd.read_csv(data_dir / 'account_information.csv')
+    """Load account information (only the columns the report uses)"""
+    return pd.read_csv(
+        data_dir / 'account_information.csv',
+        engine='pyarrow', usecols=['Account', 'AccountName'], dtype={'Account': 'int32'}
+    )
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def df_opening_balances(df_entries):
     """Extract opening balances"""
     df = df_entries[df_entries['Text'] == 'Opening Balance'].copy()
@@ -36,57 +44,39 @@ def df_opening_balances(df_entries):
     df = df.rename(columns={'Amount': 'Opening Balance 2024'})
     return df
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def df_transactions(df_entries):
     """Extract transactions"""
-    df = df_entries[df_entries['Text'] != 'Opening Balance'].copy()
-    df['Month'] = df['Date'].dt.month
-    return df
+    return df_entries[df_entries['Text'] != 'Opening Balance'].copy()
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def df_report(df_info, df_opening_balances, df_transactions):
     """Create full report with monthly balances"""
     # Merge
-    df = pd.merge(df_info, df_opening_balances, on='Account', how='outer')
+    df = pd.merge(df_info, df_opening_balances, on='Account', how='left', validate='one_to_one')
     
     # Calculate monthly balances
-    month_names = [
-        'January', 'February', 'March', 'April', 'May', 'June',
-        'July', 'August', 'September', 'October', 'November', 'December'
-    ]
-    
-    for month_num in range(1, 13):
-        month_name = month_names[month_num - 1]
-        trans_up_to_month = df_transactions[df_transactions['Month'] <= month_num]
-        trans_sum = trans_up_to_month.groupby('Account')['Amount'].sum()
-        column_name = f'Balance end of {month_name}'
-        df[column_name] = df['Opening Balance 2024'] + df['Account'].map(trans_sum).fillna(0)
+    monthly = cumulative_monthly_totals(df_transactions, df['Account'])
+    df[list(BALANCE_COLS)] = monthly + df['Opening Balance 2024'].to_numpy()[:, None]
     
     # Add YTD
-    trans_ytd = df_transactions.groupby('Account')['Amount'].sum()
-    df['Sum of Transactions YTD'] = df['Account'].map(trans_ytd).fillna(0)
+    trans_ytd = df_transactions.groupby('Account', sort=False)['Amount'].sum()
+    df['Sum of Transactions YTD'] = trans_ytd.reindex(df['Account'].values, fill_value=0.0).to_numpy()
     
     return df
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def df_final_report(df_report):
     """Create final report with correct column order"""
-    df = df_report.drop(columns=['OpenDate', 'CloseDate'], errors='ignore')
-    
-    month_names = [
-        'January', 'February', 'March', 'April', 'May', 'June',
-        'July', 'August', 'September', 'October', 'November', 'December'
-    ]
-    
     final_columns = [
         'Account',
         'AccountName',
         'Opening Balance 2024'
-    ] + [f'Balance end of {month}' for month in month_names] + [
+    ] + list(BALANCE_COLS) + [
         'Sum of Transactions YTD'
     ]
     
-    return df[final_columns]
+    return df_report[final_columns]
 
 # ========================================
 # TEST 1: Load and Process Account Entries
@@ -99,9 +89,17 @@ class TestAccountEntries:
         """Test correct number of entries loaded"""
         assert len(df_entries) == 16, "Expected 16 entries"
     
-    def test_date_parsing(self, df_entries):
-        """Test date column parsed to datetime"""
-        assert pd.api.types.is_datetime64_any_dtype(df_entries['Date']), "Date should be datetime"
+    def test_month_extraction(self, df_entries):
+        """Test month extracted from date as int8 in range 1-12"""
+        assert df_entries['Month'].dtype == 'int8', "Month should be int8"
+        assert df_entries['Month'].between(1, 12).all(), "Month outside 1-12"
+        assert df_entries.loc[df_entries['Date'] == '15/03/2024', 'Month'].tolist() == [3]
+    
+    @pytest.mark.parametrize('date', ['15/13/2024', '15/00/2024', '45/03/2024', '5/3/2024', '2024-03-15'])
+    def test_invalid_date_rejected(self, date):
+        """Test dates with bad day, month or format raise instead of being misbooked"""
+        with pytest.raises(ValueError):
+            extract_month(pd.Series(['18/01/2024', date]))
     
     def test_no_missing_values(self, df_entries):
         """Test no missing values in critical columns"""
@@ -127,14 +125,12 @@ class TestAccountInformation:
         assert len(df_info) == 4, "Expected 4 accounts"
     
     def test_required_columns(self, df_info):
-        """Test all required columns present"""
-        required_cols = ['Account', 'AccountName', 'OpenDate', 'CloseDate']
-        for col in required_cols:
-            assert col in df_info.columns, f"Missing column: {col}"
+        """Test only the required columns are loaded"""
+        assert list(df_info.columns) == ['Account', 'AccountName'], "Expected only Account and AccountName"
     
     def test_account_dtype(self, df_info):
-        """Test Account column is int64"""
-        assert df_info['Account'].dtype == 'int64', "Account should be int64"
+        """Test Account column is int32"""
+        assert df_info['Account'].dtype == 'int32', "Account should be int32"
     
     def test_no_duplicates(self, df_info):
         """Test no duplicate accounts"""
@@ -178,10 +174,7 @@ class TestFinalReport:
     
     def test_monthly_columns(self, df_final_report):
         """Test all 12 monthly balance columns exist"""
-        month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                      'July', 'August', 'September', 'October', 'November', 'December']
-        for month in month_names:
-            col_name = f'Balance end of {month}'
+        for col_name in BALANCE_COLS:
             assert col_name in df_final_report.columns, f"Missing column: {col_name}"
     
     def test_ytd_column(self, df_final_report):
@@ -190,10 +183,10 @@ class TestFinalReport:
     
     def test_balance_accuracy(self, df_final_report):
         """Test balance calculation accuracy (Dec = Opening + YTD)"""
-        for _, row in df_final_report.iterrows():
-            expected = row['Opening Balance 2024'] + row['Sum of Transactions YTD']
-            actual = row['Balance end of December']
-            assert abs(expected - actual) < 0.01, f"Balance mismatch for {row['AccountName']}"
+        actual = df_final_report['Balance end of December'].to_numpy()
+        expected = (df_final_report['Opening Balance 2024'] + df_final_report['Sum of Transactions YTD']).to_numpy()
+        matches = np.isclose(actual, expected, rtol=0, atol=0.01)
+        assert matches.all(), f"Balance mismatch for {df_final_report['AccountName'][~matches].tolist()}"
     
     def test_no_missing_values(self, df_final_report):
         """Test no missing values in final report"""
@@ -201,12 +194,47 @@ class TestFinalReport:
     
     def test_data_types(self, df_final_report):
         """Test data types are correct"""
-        assert df_final_report['Account'].dtype == 'int64', "Account should be int64"
+        assert df_final_report['Account'].dtype == 'int32', "Account should be int32"
         assert df_final_report['Opening Balance 2024'].dtype == 'float64', "Balances should be float64"
     
     def test_financial_totals(self, df_final_report):
         """Test financial totals are consistent"""
-        total_opening = df_final_report['Opening Balance 2024'].sum()
-        total_ytd = df_final_report['Sum of Transactions YTD'].sum()
-        total_closing = df_final_report['Balance end of December'].sum()
-        assert abs(total_closing - (total_opening + total_ytd)) < 0.01, "Total balance mismatch"
\ No newline at end of file
+        total_opening, total_ytd, total_closing = df_final_report[
+            ['Opening Balance 2024', 'Sum of Transactions YTD', 'Balance end of December']
+        ].to_numpy().sum(axis=0)
+        assert abs(total_closing - (total_opening + total_ytd)) < 0.01, "Total balance mismatch"
+
+# ========================================
+# TEST 5: Monthly Balance Calculation
+# ========================================
+
+class TestMonthlyBalances:
+    """Tests for cumulative monthly balances against independent references"""
+    
+    def test_known_balances(self, df_final_report):
+        """Test monthly balances against hand-checked values"""
+        balances = df_final_report.set_index('AccountName')
+        assert balances.loc['Operations', 'Balance end of February'] == pytest.approx(87000.00)
+        assert balances.loc['Operations', 'Balance end of March'] == pytest.approx(88250.75)
+        assert balances.loc['Technology', 'Balance end of February'] == pytest.approx(64700.00)
+        assert balances.loc['Marketing', 'Balance end of January'] == pytest.approx(125450.00)
+    
+    def test_all_months_match_filter_and_sum(self, df_final_report, df_transactions):
+        """Test all 12 monthly balances against a per-month filter-and-sum"""
+        for month_num, col_name in enumerate(BALANCE_COLS, start=1):
+            trans_up_to_month = df_transactions[df_transactions['Month'] <= month_num]
+            trans_sum = trans_up_to_month.groupby('Account')['Amount'].sum()
+            expected = df_final_report['Opening Balance 2024'] + df_final_report['Account'].map(trans_sum).fillna(0)
+            assert np.allclose(df_final_report[col_name], expected, rtol=0, atol=0.01), f"Mismatch in {col_name}"
+    
+    def test_account_without_transactions(self):
+        """Test accounts with no transactions get zero totals and unknown accounts are ignored"""
+        transactions = pd.DataFrame({
+            'Account': [1, 1, 3],
+            'Month': np.array([2, 5, 1], dtype=np.int8),
+            'Amount': [100.0, 50.0, 999.0],
+        })
+        totals = cumulative_monthly_totals(transactions, pd.Series([1, 2]))
+        assert totals.shape == (2, 12)
+        assert totals[0].tolist() == [0, 100, 100, 100, 150, 150, 150, 150, 150, 150, 150, 150]
+        assert (totals[1] == 0).all(), "Account without transactions should stay at 0"